@@ -14,10 +14,12 @@ My Setup (macOS, Python 3.9):
    2. Installed OCR/system tools:
         brew install tesseract poppler
    3. Installed Python libraries:
-        pip3 install pymupdf pdfminer.six pillow pytesseract pdf2image python-dateutil
+        pip3 install pymupdf pypdfium2 pdfminer.six pillow pytesseract pdf2image python-dateutil
+        pip3 install google-re2 orjson tesserocr   # optional: faster date scan / JSON output / OCR
 
 Optional toggle:
    export FORCE_OCR=1   # force OCR even if text is extractable
+   export OCR_DPI=300   # OCR render resolution (default 200)
 
 How I tested:
    - Ran: python3 mitali_jadhav.py contract.pdf output.json
@@ -29,10 +31,13 @@ Performance:
 """
 
 import json, os, re, sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 # ---------- Optional imports with graceful fallback ----------
 try:
@@ -41,6 +46,12 @@ try:
 except Exception:
     HAVE_PYMUPDF = False
 
+try:
+    import pypdfium2 as pdfium
+    HAVE_PDFIUM = True
+except Exception:
+    HAVE_PDFIUM = False
+
 try:
     from pdfminer.high_level import extract_text as pdfminer_extract_text
     HAVE_PDFMINER = True
@@ -48,7 +59,7 @@ except Exception:
     HAVE_PDFMINER = False
 
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     from PIL import Image
     import pytesseract
     HAVE_OCR = True
@@ -61,6 +72,18 @@ try:
 except Exception:
     HAVE_DATEUTIL = False
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+try:
+    import re2
+    HAVE_RE2 = True
+except Exception:
+    HAVE_RE2 = False
+
 @dataclass
 class Clause:
     text: str
@@ -75,28 +98,122 @@ class Section:
 
 
 # -------------------- Helpers --------------------
-WS_RE = re.compile(r"\s+")
-CAMEL_GAP_RE = re.compile(r'([a-z])([A-Z])')          
-LETTER_DIGIT_GAP_RE = re.compile(r'([A-Za-z])(\d)')   
-DIGIT_LETTER_GAP_RE = re.compile(r'(\d)([A-Za-z])')   
+# RE2's \s and \d are ASCII-only; these classes give stdlib re's Unicode meaning
+RE2_UNICODE_CLASSES = {r"\s": r"[\t\n\x0b\f\r\x1c-\x1f\x85\p{Z}]", r"\d": r"\p{Nd}"}
+
+def fast_compile(pattern: str, flags: int = 0):
+    r"""
+    Compile with RE2 when available, else stdlib re. Only worth it for
+    unanchored scans over long text: RE2's per-call overhead makes short
+    anchored matches slower. \b stays ASCII-only under RE2.
+    """
+    if HAVE_RE2:
+        try:
+            opts = re2.Options()
+            opts.max_mem = 8 << 20
+            for cls, uni in RE2_UNICODE_CLASSES.items():
+                pattern = pattern.replace(cls, uni)
+            return re2.compile(("(?i)" if flags & re.I else "") + pattern, options=opts)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+# Gaps to open in squashed text: lower→Upper, letter→digit, digit→letter
+SQUASH_GAP_RE = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Za-z])(?=\d)|(?<=\d)(?=[A-Za-z])')
 def norm_ws(s: str) -> str:
-    return WS_RE.sub(" ", s).strip()
+    # str.split() collapses any Unicode whitespace run in C, no regex needed
+    return " ".join(s.split())
 
 def desquash(s: str) -> str:
     """Insert missing spaces in squashed text like 'ThisCar' → 'This Car'."""
     if not s:
         return s
-    s = CAMEL_GAP_RE.sub(r'\1 \2', s)
-    s = LETTER_DIGIT_GAP_RE.sub(r'\1 \2', s)
-    s = DIGIT_LETTER_GAP_RE.sub(r'\1 \2', s)
-    return s
+    return SQUASH_GAP_RE.sub(" ", s)
 
 def write_json(path: Path, obj):
+    if HAVE_ORJSON:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
     path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
 def is_scanned(text: str) -> bool:
     return len(re.sub(r"\s", "", text or "")) < 20
 
+def _to_png(img) -> bytes:
+    buf = BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+OCR_CONFIG = "--oem 1 --psm 6"  # LSTM engine, single uniform text block
+
+_TESS_API = None  # tesserocr handle, one per worker process
+
+def _tess_api():
+    """Lazily open a persistent Tesseract instance; None if tesserocr is unusable."""
+    global _TESS_API
+    if _TESS_API is None:
+        try:
+            # imported here, inside the worker: libtesseract's OpenMP runtime reads
+            # OMP_THREAD_LIMIT at load time, which extract_text_pages sets before forking
+            import tesserocr
+            _TESS_API = tesserocr.PyTessBaseAPI(
+                lang="eng", oem=tesserocr.OEM.LSTM_ONLY, psm=tesserocr.PSM.SINGLE_BLOCK
+            )
+        except Exception:
+            _TESS_API = False
+    return _TESS_API or None
+
+def _ocr_one(png: bytes) -> str:
+    """OCR worker: takes a PNG-encoded page (cheap to pickle) and returns its text."""
+    with Image.open(BytesIO(png)) as img:
+        api = _tess_api()
+        if api is not None:
+            # model stays loaded across pages instead of one tesseract process per page
+            api.SetImage(img)
+            return api.GetUTF8Text() or ""
+        return pytesseract.image_to_string(img, config=OCR_CONFIG) or ""
+
+BLANK_MAX_INK_PIXELS = 200  # dark pixels at 200 DPI still treated as scan specks, not text
+
+def _is_blank(gray, dpi: int) -> bool:
+    """Cheap histogram check on a grayscale page so blank pages never reach Tesseract."""
+    if gray.getextrema()[0] >= 240:
+        return True
+    ink = sum(gray.histogram()[:240])
+    return ink < BLANK_MAX_INK_PIXELS * (dpi / 200) ** 2
+
+def _page_count(pdf_path: Path) -> int:
+    if HAVE_PDFIUM:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    return int(pdfinfo_from_path(str(pdf_path))["Pages"])
+
+def _iter_page_pngs(pdf_path: Path, idxs: List[int], dpi: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    Render pages one at a time in grayscale (OCR needs no colour) and
+    yield (index, PNG bytes); blank pages are skipped. Only one raw bitmap
+    is alive at once, but PNGs of pages still waiting for a worker stay
+    queued in memory (~120 KB per page at 200 DPI).
+    """
+    if HAVE_PDFIUM:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for i in idxs:
+                if i < len(pdf):
+                    img = pdf[i].render(scale=dpi / 72, grayscale=True).to_pil()
+                    if not _is_blank(img, dpi):
+                        yield i, _to_png(img)
+        finally:
+            pdf.close()
+    else:
+        for i in idxs:
+            for img in convert_from_path(str(pdf_path), dpi=dpi, first_page=i + 1, last_page=i + 1, grayscale=True):
+                if not _is_blank(img, dpi):
+                    yield i, _to_png(img)
+
 
 # -------------------- Text extraction --------------------
 def extract_text_pages(pdf_path: Path) -> List[str]:
@@ -104,32 +221,68 @@ def extract_text_pages(pdf_path: Path) -> List[str]:
     Returns list of page strings.
     """
     pages: List[str] = []
+    needs_ocr: List[bool] = []  # per page: no usable text layer
     FORCE_OCR = os.getenv("FORCE_OCR") == "1"
+    try:
+        OCR_DPI = int(os.getenv("OCR_DPI", "200"))
+    except ValueError:
+        OCR_DPI = 200
+    if OCR_DPI <= 0:
+        OCR_DPI = 200
 
     # 1) PyMuPDF
     if not FORCE_OCR and HAVE_PYMUPDF:
         try:
             with fitz.open(pdf_path) as doc:
-                pages = [page.get_text("text") or "" for page in doc]
+                for page in doc:
+                    tp = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)  # same flags as get_text("text")
+                    text = tp.extractText() or ""
+                    pages.append(text)
+                    needs_ocr.append(is_scanned(text))
         except Exception:
-            pages = []
+            pages, needs_ocr = [], []
 
-    # 2) pdfminer.six
-    if not FORCE_OCR and (not pages or is_scanned("".join(pages))) and HAVE_PDFMINER:
+    # 2) pypdfium2
+    if not FORCE_OCR and all(needs_ocr) and HAVE_PDFIUM:
+        try:
+            pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                pages = [page.get_textpage().get_text_range() or "" for page in pdf]
+            finally:
+                pdf.close()
+            needs_ocr = [is_scanned(p) for p in pages]
+        except Exception:
+            pass
+
+    # 3) pdfminer.six — slowest extractor, last resort before OCR
+    if not FORCE_OCR and all(needs_ocr) and HAVE_PDFMINER:
         try:
             text = pdfminer_extract_text(str(pdf_path)) or ""
             pages = text.split("\f") if "\f" in text else [text]
+            needs_ocr = [is_scanned(p) for p in pages]
         except Exception:
             pass
 
-    # 3) OCR
-    if FORCE_OCR or (not pages or is_scanned("".join(pages))):
-        if HAVE_OCR:
-            try:
-                images = convert_from_path(str(pdf_path), dpi=300)
-                pages = [pytesseract.image_to_string(img) or "" for img in images]
-            except Exception:
-                pass
+    # 4) OCR — whole document if forced or nothing came back, else only the pages without text
+    if FORCE_OCR or not pages:
+        ocr_idxs = None
+    else:
+        ocr_idxs = [i for i, flag in enumerate(needs_ocr) if flag]
+    if (ocr_idxs is None or ocr_idxs) and HAVE_OCR:
+        try:
+            if ocr_idxs is None:
+                n = _page_count(pdf_path)
+                ocr_idxs, pages = list(range(n)), [""] * n
+            # one Tesseract per core; keep its own OpenMP threads from oversubscribing
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            workers = max(1, min(len(ocr_idxs), os.cpu_count() or 1))
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                # pages are rendered lazily while earlier ones are already being OCR'd
+                futures = [(i, ex.submit(_ocr_one, png)) for i, png in _iter_page_pngs(pdf_path, ocr_idxs, OCR_DPI)]
+                for i, fut in futures:
+                    pages[i] = fut.result()
+        except Exception:
+            pass
 
     return [p if isinstance(p, str) else "" for p in pages]
 
@@ -137,8 +290,8 @@ def extract_text_pages(pdf_path: Path) -> List[str]:
 # -------------------- Title & type --------------------
 TITLE_RE = re.compile(r"(AGREEMENT|CONTRACT|NDA|AMENDMENT|STATEMENT OF WORK|LICENSE|LEASE)", re.I)
 
-def guess_title(pages: List[str], filename: str):
-    first = pages[0].splitlines() if pages else []
+def guess_title(page_lines: List[List[str]], filename: str):
+    first = page_lines[0] if page_lines else []
     for line in first:
         if TITLE_RE.search(line):
             return norm_ws(line), "Agreement"
@@ -158,22 +311,59 @@ DATE_PATTERNS = [
     r'\b(\d{4}-\d{2}-\d{2})\b'
 ]
 
-def find_effective_date(all_text: str) -> Optional[str]:
-    txt = " " + (all_text or "") + " "
-    for pat in DATE_PATTERNS:
-        m = re.search(pat, txt, flags=re.I)
-        if not m:
+# All patterns fused into one alternation; group d<k> carries the date for DATE_PATTERNS[k]
+EFFECTIVE_DATE_RE = fast_compile(
+    "|".join(f"(?:{re.sub(r'[(](?![?])', f'(?P<d{k}>', p, count=1)})" for k, p in enumerate(DATE_PATTERNS)),
+    re.I
+)
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+def _parse_date(date_str: str) -> Optional[str]:
+    date_str = date_str.strip()
+    try:
+        if HAVE_DATEUTIL:
+            dt = date_parser.parse(date_str, fuzzy=True)
+        else:
+            dt = datetime.strptime(date_str, "%B %d, %Y")
+        return dt.strftime("%Y-%m-%d")
+    except Exception:
+        if ISO_DATE_RE.match(date_str):
+            return date_str
+    return None
+
+def _search_date(text: str) -> Optional[str]:
+    txt = " " + (text or "") + " "
+    # single scan: first hit per pattern; a top-priority hit that parses ends the scan early
+    hits = {}
+    for m in EFFECTIVE_DATE_RE.finditer(txt):
+        k = int(m.lastgroup[1:])
+        if k in hits:
             continue
-        date_str = m.group(1).strip()
-        try:
-            if HAVE_DATEUTIL:
-                dt = date_parser.parse(date_str, fuzzy=True)
-            else:
-                dt = datetime.strptime(date_str, "%B %d, %Y")
-            return dt.strftime("%Y-%m-%d")
-        except Exception:
-            if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-                return date_str
+        hits[k] = m.group(m.lastgroup)
+        if k == 0:
+            edate = _parse_date(hits[0])
+            if edate:
+                return edate
+    for k in sorted(hits):
+        if k == 0:
+            continue  # already tried above
+        edate = _parse_date(hits[k])
+        if edate:
+            return edate
+    return None
+
+DATE_HEAD_CHARS = 4096  # preamble window checked before anything else
+
+def find_effective_date(pages: List[str]) -> Optional[str]:
+    """Search the preamble first, then page by page; the date almost always sits on page 1."""
+    if pages and len(pages[0]) > DATE_HEAD_CHARS:
+        edate = _search_date(pages[0][:DATE_HEAD_CHARS])
+        if edate:
+            return edate
+    for page in pages:
+        edate = _search_date(page)
+        if edate:
+            return edate
     return None
 
 
@@ -193,6 +383,17 @@ TIME_LIKE_RE = re.compile(r"^(?:\d{1,2}[:\.]\d{2})(?:\s?(?:am|pm))?$", re.I)
 def protect_times(s: str) -> str:
     return TIME_DOT_RE.sub(r'\1:\2', s or "")
 
+@lru_cache(maxsize=4096)
+def _normalize_short_line(s: str) -> str:
+    return protect_times(norm_ws(desquash(s)))
+
+def normalize_line(s: str) -> str:
+    """desquash + whitespace collapse + time protection for one raw line."""
+    # short lines repeat a lot (headers, footers, page numbers, "Initials: ___")
+    if len(s) < 128:
+        return _normalize_short_line(s)
+    return protect_times(norm_ws(desquash(s)))
+
 def looks_like_time_token(token: str) -> bool:
     return bool(TIME_LIKE_RE.match(token or ""))
 
@@ -225,18 +426,20 @@ def likely_heading(number: str, title: str) -> bool:
     return False
 
 
-# Clause patterns
-CLAUSE_RE = [
-    re.compile(r"^\(([a-z])\)\s+(.*)$"),          
-    re.compile(r"^\(([A-Z])\)\s+(.*)$"),          
-    re.compile(r"^\(([ivx]+)\)\s+(.*)$", re.I),   
-    re.compile(r"^([a-z])\.\s+(.*)$"),            
-    re.compile(r"^([A-Z])\.\s+(.*)$"),            
-    re.compile(r"^([ivx]+)\.\s+(.*)$", re.I),     
-    re.compile(r"^(\d+(?:\.\d+)+)\s+(.*)$"),      
-    re.compile(r"^(\d+)[\.\)]\s+(.*)$"),          
-    re.compile(r"^([A-Z][A-Z ]{2,})[:\-]\s*(.*)$")
-]
+# Clause patterns — one alternation, tried in order; the named group that matched holds the label
+CLAUSE_RE = re.compile(
+    r"^(?:"
+    r"\((?P<par_lc>[a-z])\)\s+"
+    r"|\((?P<par_uc>[A-Z])\)\s+"
+    r"|(?i:\((?P<par_roman>[ivx]+)\))\s+"
+    r"|(?P<dot_lc>[a-z])\.\s+"
+    r"|(?P<dot_uc>[A-Z])\.\s+"
+    r"|(?i:(?P<dot_roman>[ivx]+))\.\s+"
+    r"|(?P<multilevel>\d+(?:\.\d+)+)\s+"
+    r"|(?P<num>\d+)[\.\)]\s+"
+    r"|(?P<caps>[A-Z][A-Z ]{2,})[:\-]\s*"
+    r")"
+)
 
 # Inline bullet splitter:
 INLINE_BULLET_SPLIT_RE = re.compile(
@@ -255,7 +458,15 @@ def explode_inline_bullets(line: str) -> List[str]:
     Split '...: a. text b. text' into ['a. text','b. text'] + keep preamble.
     Avoid splitting a stray leading page number like '1. The Term ...'.
     """
-    tokens = list(INLINE_BULLET_SPLIT_RE.finditer(line or ""))
+    # every label ends in '.' or ')' — most lines have neither and need no regex at all
+    if not line or ("." not in line and ")" not in line):
+        return [line]
+    if ";" in line or ":" in line:
+        tokens = list(INLINE_BULLET_SPLIT_RE.finditer(line))
+    else:
+        # without a ';'/':' separator a label can only sit at the very start
+        m = INLINE_BULLET_SPLIT_RE.match(line)
+        tokens = [m] if m else []
     if not tokens:
         return [line]
 
@@ -283,10 +494,16 @@ def explode_inline_bullets(line: str) -> List[str]:
     return parts
 
 
-def parse_sections(pages: List[str]) -> List[Section]:
-    raw_lines = [norm_ws(desquash(l)) for p in pages for l in p.splitlines()]
-    raw_lines = [protect_times(l) for l in raw_lines if l]
+def _iter_lines(page_lines: List[List[str]]):
+    """Yield normalized, non-empty lines across all pages without building a list."""
+    for lines in page_lines:
+        for l in lines:
+            l = normalize_line(l)
+            if l:
+                yield l
+
 
+def parse_sections(page_lines: List[List[str]]) -> List[Section]:
     sections: List[Section] = []
     cur_title: Optional[str] = None
     cur_num: Optional[str] = None
@@ -299,14 +516,14 @@ def parse_sections(pages: List[str]) -> List[Section]:
             for l in cur_body:
                 expanded.extend(explode_inline_bullets(l))
             clauses = segment_clauses(expanded)
-            sections.append(Section(title=norm_ws(cur_title), number=cur_num, clauses=clauses))
+            sections.append(Section(title=cur_title, number=cur_num, clauses=clauses))
         cur_title, cur_num, cur_body = None, None, []
 
-    for line in raw_lines:
+    for line in _iter_lines(page_lines):
         m = SEC_RE.match(line)
         if m:
             num = m.group(1)
-            ttl = norm_ws(m.group(2))
+            ttl = m.group(2)  # tail of an already-normalized line
             if likely_heading(num, ttl):
                 flush()
                 cur_num, cur_title = num, ttl
@@ -342,29 +559,22 @@ def segment_clauses(lines: List[str]) -> List[Clause]:
             clauses.append(Clause(text=norm_ws(" ".join(cur_parts)), label=(cur_label or ""), index=len(clauses)))
         cur_label, cur_parts = "", []
 
+    # local aliases: skip global/attribute lookups on every line
+    match, norm = CLAUSE_RE.match, norm_ws
     for l in lines:
-        matched = False
-        for patt in CLAUSE_RE:
-            m = patt.match(l)
-            if m:
-                flush_clause()
-                cur_label = norm_ws(m.group(1))
-                rem = ""
-                if m.lastindex and m.lastindex >= 2:
-                    rem = m.group(2)
-                elif m.lastindex:
-                    rem = m.group(m.lastindex)
-                cur_parts = [norm_ws(rem)] if rem else []
-                matched = True
-                break
-        if not matched:
+        m = match(l)
+        if m:
+            flush_clause()
+            cur_label = norm(m.group(m.lastgroup))
+            rem = l[m.end():]  # lines arrive normalized; the match eats the separating space
+            cur_parts = [rem] if rem else []
+        else:
             cur_parts.append(l)
     flush_clause()
 
     # schema requirements
     for i, c in enumerate(clauses):
         c.index = i
-        c.text = norm_ws(c.text)
         c.label = c.label if isinstance(c.label, str) else ""
     return clauses
 
@@ -372,9 +582,10 @@ def segment_clauses(lines: List[str]) -> List[Clause]:
 # -------------------- Main parse --------------------
 def parse_contract(pdf_path: Path):
     pages = extract_text_pages(pdf_path)
-    title, ctype = guess_title(pages, pdf_path.name)
-    edate = find_effective_date("\n".join(pages))
-    sections = parse_sections(pages)
+    page_lines = [p.splitlines() for p in pages]  # split once, shared by title + sections
+    title, ctype = guess_title(page_lines, pdf_path.name)
+    edate = find_effective_date(pages)
+    sections = parse_sections(page_lines)
 
     return {
         "title": title,